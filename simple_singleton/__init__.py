@@ -1,4 +1,4 @@
-from simple_singleton.singleton import is_singleton, singleton
+from simple_singleton.singleton import is_singleton, register_many, singleton
 
 __version__ = "0.1.0"
-__all__ = ["singleton", "is_singleton"]
+__all__ = ["singleton", "is_singleton", "register_many"]
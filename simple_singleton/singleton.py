@@ -1,12 +1,114 @@
-from functools import wraps
-from threading import Lock
-from types import MethodType
-from typing import Any, Callable, Optional, Type, TypeVar, Union, cast, overload
+import builtins
+import sys
+from threading import RLock
+from types import CodeType, FunctionType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+    overload,
+)
 
 _T = TypeVar("_T")
+_F = TypeVar("_F", bound=Callable[..., Any])
 _SINGLETON_FLAG = "__singleton_flag__"
 
 
+class _SingletonState:
+    """Per-class singleton state, kept in one fixed-layout object."""
+
+    __slots__ = ("instance", "initialized", "lock", "original_new", "original_init")
+
+    def __init__(
+        self,
+        original_new: Callable[..., Any],
+        original_init: Callable[..., None],
+        lock: Optional[Any],
+    ) -> None:
+        self.instance: Any = None
+        self.initialized = False
+        self.lock = lock
+        self.original_new = original_new
+        self.original_init = original_init
+
+
+def _as_method(func: _F, cls: type, name: str) -> _F:
+    # Cheaper than functools.wraps, only the module and names are copied so the
+    # installed methods still show up under the decorated class
+    func.__module__ = cls.__module__
+    func.__name__ = name
+    func.__qualname__ = f"{cls.__qualname__}.{name}"
+    return func
+
+
+def _new_object(cls: Type[_T], *args: Any, **kwargs: Any) -> _T:
+    # object.__new__ rejects extra arguments once __new__ is overridden
+    return object.__new__(cls)
+
+
+# Source snippets the generated __new__ is assembled from. The decorator flags
+# decide which snippets are used, so the generated code never checks them.
+_NEW_HEADER = """\
+def __new__(cls, *args, **kwargs):
+    if cls is not _original_cls:
+"""
+_NEW_SUBCLASS_ALLOWED = """\
+        # The subclass caches its own instance
+        _check_subclass(cls)
+        return _create_instance(cls, *args, **kwargs)
+"""
+# __init_subclass__ rejects most subclasses when they are defined, this catches
+# the ones that bypass it, e.g. through another base's __init_subclass__
+_NEW_SUBCLASS_DISALLOWED = """\
+        raise TypeError(
+            f"Singleton class {_original_cls.__name__} cannot be inherited",
+        )
+"""
+_NEW_CREATE = """\
+    instance = _create_instance(cls, *args, **kwargs)
+    _cache_instance(instance)
+    return instance
+"""
+_NEW_CREATE_LOCKED = """\
+    with _state.lock:
+        # Double-checked locking to avoid duplicate creation, the first check
+        # is done by the cached __new__
+        instance = _state.instance
+        if instance is None:
+            instance = _create_instance(cls, *args, **kwargs)
+            _cache_instance(instance)
+    return instance
+"""
+
+# Compiled __new__ code shared by every class decorated with the same flags
+_new_code_cache: Dict[Tuple[bool, bool], CodeType] = {}
+
+
+def _new_code(thread_safe: bool, allow_subclass: bool) -> CodeType:
+    key = (thread_safe, allow_subclass)
+    code = _new_code_cache.get(key)
+
+    if code is None:
+        source = (
+            _NEW_HEADER
+            + (_NEW_SUBCLASS_ALLOWED if allow_subclass else _NEW_SUBCLASS_DISALLOWED)
+            + (_NEW_CREATE_LOCKED if thread_safe else _NEW_CREATE)
+        )
+        namespace: Dict[str, Any] = {}
+        exec(compile(source, f"<singleton __new__ {key}>", "exec"), namespace)
+        code = _new_code_cache[key] = namespace["__new__"].__code__
+
+    return code
+
+
 @overload
 def singleton(_cls: Type[_T]) -> Type[_T]: ...  # pragma: no cover
 
@@ -75,11 +177,9 @@ def singleton(
             ...
 
         @singleton
-        class Subclass(UnsubclassableSingleton):
+        class Subclass(UnsubclassableSingleton):  # Raises TypeError when defined
             ...
 
-        Subclass()  # Raise TypeError when instance
-
     Each subclass must also be a singleton, otherwise, a TypeError is raised.
     ::
 
@@ -138,7 +238,9 @@ def singleton(
     This implementation overrides the class's __new__ and __init__ methods.
     Whether the original class's __init__ method is overridden depends on the
     allow_reassignment flag. If this flag is set to true, __init__ will be
-    overridden; otherwise, it won't be.
+    overridden; otherwise, it won't be. When the allow_subclass flag is false,
+    the class's __init_subclass__ is also replaced by one that rejects every
+    subclass, so an __init_subclass__ defined on the class itself will not run.
 
     After using the singleton decorator, a class attribute named __singleton_flag__
     is added to the original class, which holds the name of the last class
@@ -148,29 +250,34 @@ def singleton(
     and typically, this value should always match the class name. When using
     this decorator, avoid using the identifier __singleton_flag__ in your classes.
 
-    Subclass checking is implemented using assertions, making it easy to disable
-    them in production environments to enhance performance. However, it's
-    advised not to disable these assertions during development as they help
-    prevent logical errors, such as a singleton subclass not being unique.
-    Do not use exceptions raised by this decorator for purposes other than
-    intended, as exceptions related to subclass checks will not be thrown once
-    subclass checking is disabled.
+    Subclassing a singleton that does not allow it raises a TypeError as soon
+    as the subclass is defined. Subclasses that skip this check, such as ones
+    created before decorating, raise the TypeError when instantiated instead.
+    For singletons that allow subclassing, a subclass that is not decorated
+    itself raises a TypeError when it is instantiated. Do not use exceptions
+    raised by this decorator for purposes other than intended.
     """
 
     def decorator(original_cls: Type[_T]) -> Type[_T]:
-        _lock: Lock = Lock()
-        _instance: Optional[_T] = None
-        _is_initialized: bool = False
-        _original_new: Callable[..., _T] = original_cls.__new__
-        _original_init: Callable[..., None] = original_cls.__init__
+        # Validate before building anything for the class
+        if not isinstance(original_cls, type):
+            raise TypeError(
+                "singleton decorator can only be applied to classes",
+            )
 
-        def _check_subclass(cls: Type[_T]) -> bool:
-            if not allow_subclass:
-                raise TypeError(
-                    f"Singleton class {original_cls.__name__} cannot be inherited",
-                )
+        # Only the thread-safe implementations need a lock. It is reentrant
+        # because user code runs while it is held and may instantiate the
+        # class again from the same thread
+        state = _SingletonState(
+            original_cls.__new__,
+            original_cls.__init__,
+            RLock() if thread_safe else None,
+        )
 
-            if getattr(cls, _SINGLETON_FLAG, None) != cls.__name__:
+        def _check_subclass(cls: Type[_T]) -> bool:
+            # Only the class's own namespace matters, a subclass with the same
+            # name as its decorated parent would match the inherited flag
+            if cls.__dict__.get(_SINGLETON_FLAG) != cls.__name__:
                 # Not using singleton decorator
                 raise TypeError(
                     f"Subclass {cls.__name__} must also be a singleton",
@@ -178,52 +285,92 @@ def singleton(
 
             return True
 
-        def _create_instance(cls: Type[_T], *args: Any, **kwargs: Any) -> _T:
-            # Create instance by original init method
-            if _original_new is object.__new__:
-                return _original_new(cls)
-            return _original_new(cls, *args, **kwargs)
-
-        @wraps(original_cls.__new__)
-        def __new__(cls: Type[_T], *args: Any, **kwargs: Any) -> _T:
-            nonlocal _instance
-            cls = args[0]
-
-            if cls is not original_cls:
-                # if cls is a subclass of original_cls
-                _check_subclass(cls)
-                _instance = _create_instance(cls, *args, **kwargs)
-                return _instance
-
-            if _instance is None:
-                if thread_safe:
-                    with _lock:
-                        # Double-checked locking to avoid duplicate creation
-                        if _instance is None:
-                            _instance = _create_instance(cls, *args, **kwargs)
-                        else:
-                            pass  # For test coverage
-                else:
-                    _instance = _create_instance(cls, *args, **kwargs)
-            return _instance
+        def _install_new(new: Callable[..., _T]) -> None:
+            # Stored as a staticmethod, the same way Python stores a __new__
+            # defined in the class body
+            original_cls.__new__ = staticmethod(
+                _as_method(new, original_cls, "__new__")
+            )
 
-        @wraps(original_cls.__init__)
-        def __init__(self: _T, *args: Any, **kwargs: Any) -> None:
-            nonlocal _is_initialized
+        def _cache_instance(instance: _T) -> None:
+            state.instance = instance
+
+            # Once the instance exists, calls for the class itself only need to
+            # return it, so swap in a minimal __new__ for them
+            def _cached_new(cls: Type[_T], *args: Any, **kwargs: Any) -> _T:
+                if cls is original_cls:
+                    return instance
+                return __new__(cls, *args, **kwargs)
+
+            _install_new(_cached_new)
+
+        # Names the generated __new__ looks up as its globals
+        namespace: Dict[str, Any] = {
+            "__builtins__": builtins,
+            "_original_cls": original_cls,
+            "_state": state,
+            "_check_subclass": _check_subclass,
+            # Decided once here instead of on every instance creation
+            "_create_instance": (
+                _new_object
+                if state.original_new is object.__new__
+                else state.original_new
+            ),
+            "_cache_instance": _cache_instance,
+        }
+
+        __new__ = FunctionType(_new_code(thread_safe, allow_subclass), namespace)
+
+        def _initialized(self: _T, *args: Any, **kwargs: Any) -> None:
+            # Subclass instances also reach the installed __init__, through
+            # inheritance or super().__init__, and still need initializing
+            if self is not state.instance:
+                state.original_init(self, *args, **kwargs)
+
+        def _initialize(self: _T, *args: Any, **kwargs: Any) -> None:
+            state.original_init(self, *args, **kwargs)
+            if self is state.instance:
+                # Later calls for the instance have nothing left to do
+                original_cls.__init__ = _as_method(
+                    _initialized, original_cls, "__init__"
+                )
 
-            if not _is_initialized:
-                _original_init(self, *args, **kwargs)
-                _is_initialized = True
+        def _initialize_locked(self: _T, *args: Any, **kwargs: Any) -> None:
+            if self is not state.instance:
+                state.original_init(self, *args, **kwargs)
+                return
+
+            with state.lock:
+                # Another thread may have entered before __init__ was swapped,
+                # and the flag is set first so a nested instantiation from the
+                # initializing thread does not run __init__ again
+                if not state.initialized:
+                    state.initialized = True
+                    try:
+                        _initialize(self, *args, **kwargs)
+                    except BaseException:
+                        state.initialized = False
+                        raise
+                else:
+                    pass  # For test coverage
 
-        if not isinstance(original_cls, type):
+        def _reject_subclass(cls: Type[_T], **kwargs: Any) -> None:
             raise TypeError(
-                "singleton decorator can only be applied to classes",
+                f"Singleton class {original_cls.__name__} cannot be inherited",
             )
 
+        if not allow_subclass:
+            # Checked once when a subclass is defined instead of on every
+            # instantiation
+            original_cls.__init_subclass__ = classmethod(
+                _as_method(_reject_subclass, original_cls, "__init_subclass__")
+            )
         if not allow_reassignment:
-            original_cls.__init__ = __init__
-        original_cls.__new__ = MethodType(__new__, original_cls)
-        setattr(original_cls, _SINGLETON_FLAG, original_cls.__name__)
+            __init__ = _initialize_locked if thread_safe else _initialize
+            original_cls.__init__ = _as_method(__init__, original_cls, "__init__")
+        _install_new(__new__)
+        # Interned so comparing it with the class name is an identity match
+        setattr(original_cls, _SINGLETON_FLAG, sys.intern(original_cls.__name__))
 
         return cast(Type[_T], original_cls)
 
@@ -234,6 +381,63 @@ def singleton(
     return decorator
 
 
+def register_many(
+    classes: Iterable[Type[Any]],
+    *,
+    thread_safe: bool = False,
+    allow_subclass: bool = False,
+    allow_reassignment: bool = False,
+) -> List[Type[Any]]:
+    """Convert several classes to singletons with the same options.
+
+    Usage:
+    ::
+
+        class ConfigService:
+            ...
+
+        class CacheService:
+            ...
+
+        register_many([ConfigService, CacheService], thread_safe=True)
+
+    This is equivalent to applying `singleton` with the same arguments to each
+    class, but the decorator is only built once. Classes decorated with the
+    same options also share the compiled code of their generated methods.
+
+    Args:
+        classes (Iterable[Type[Any]]): The classes to convert, in order.
+        thread_safe (bool, optional): Enables thread safety during instance
+            creation. Defaults to False.
+        allow_subclass (bool, optional): Allows subclassing of the singleton
+            classes. Defaults to False.
+        allow_reassignment (bool, optional): Allows reinitialization of the
+            singleton instances. Defaults to False.
+
+    Returns:
+        List[Type[Any]]: The converted classes, in the given order.
+
+    Raises:
+        TypeError: If any of the given objects is not a class. No class is
+            converted in that case.
+    """
+    classes = list(classes)
+
+    # Validate all entries first so a bad one does not leave the batch half
+    # converted
+    if not all(isinstance(cls, type) for cls in classes):
+        raise TypeError(
+            "singleton decorator can only be applied to classes",
+        )
+
+    decorator = singleton(
+        thread_safe=thread_safe,
+        allow_subclass=allow_subclass,
+        allow_reassignment=allow_reassignment,
+    )
+    return [decorator(cls) for cls in classes]
+
+
 def is_singleton(cls: Any) -> bool:
     """Check if a class is a singleton.
 
@@ -251,11 +455,13 @@ def is_singleton(cls: Any) -> bool:
     if not isinstance(cls, type):
         return False
 
+    # getattr is served by the type attribute cache
     flag = getattr(cls, _SINGLETON_FLAG, None)
 
-    # Check whether the class has flag
-    if flag is None:
+    # Check whether flag is equal to the name of the class itself
+    if flag is None or flag != cls.__name__:
         return False
 
-    # Check whether flag is equal to the name of the class itself
-    return flag == cls.__name__
+    # A subclass with the same name as its decorated parent inherits a matching
+    # flag, so make sure the class itself has it
+    return _SINGLETON_FLAG in cls.__dict__
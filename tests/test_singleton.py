@@ -1,10 +1,11 @@
 import threading
+import types
 from dataclasses import dataclass
 from itertools import product
 
 import pytest
 
-from simple_singleton import is_singleton, singleton
+from simple_singleton import is_singleton, register_many, singleton
 from simple_singleton.singleton import _SINGLETON_FLAG
 
 
@@ -19,15 +20,14 @@ def test_singleton_without_arguments():
     assert instance1 is instance2
     assert instance2.value == "initial"
 
-    @singleton
-    class SubclassSingleton(BasicSingleton):
-        pass
-
     with pytest.raises(
         TypeError,
         match=f"Singleton class {BasicSingleton.__name__} cannot be inherited",
     ):
-        SubclassSingleton("reassigned")
+
+        @singleton
+        class SubclassSingleton(BasicSingleton):
+            pass
 
 
 @pytest.mark.parametrize(
@@ -96,15 +96,86 @@ def test_disallow_subclass_singleton(thread_safe: bool, allow_reassignment: bool
     class ParentSingleton:
         pass
 
-    @singleton
-    class ChildSingleton(ParentSingleton):
+    with pytest.raises(
+        TypeError,
+        match=f"Singleton class {ParentSingleton.__name__} cannot be inherited",
+    ):
+
+        @singleton
+        class ChildSingleton(ParentSingleton):
+            pass
+
+    with pytest.raises(
+        TypeError,
+        match=f"Singleton class {ParentSingleton.__name__} cannot be inherited",
+    ):
+
+        class Child(ParentSingleton):
+            pass
+
+
+@pytest.mark.parametrize(
+    ("thread_safe", "parent_first"),
+    list(product((True, False), repeat=2)),
+)
+def test_disallow_subclass_defined_before_decorating(
+    thread_safe: bool,
+    parent_first: bool,
+):
+    class ParentSingleton:
+        pass
+
+    class Child(ParentSingleton):
+        pass
+
+    singleton(ParentSingleton, thread_safe=thread_safe)
+
+    if parent_first:
+        parent_instance = ParentSingleton()
+
+    with pytest.raises(
+        TypeError,
+        match=f"Singleton class {ParentSingleton.__name__} cannot be inherited",
+    ):
+        Child()
+
+    if parent_first:
+        assert ParentSingleton() is parent_instance
+    assert type(ParentSingleton()) is ParentSingleton
+
+
+@pytest.mark.parametrize(
+    ("thread_safe", "parent_first"),
+    list(product((True, False), repeat=2)),
+)
+def test_disallow_subclass_bypassing_init_subclass(
+    thread_safe: bool,
+    parent_first: bool,
+):
+    class Other:
+        def __init_subclass__(cls, **kwargs):
+            pass
+
+    @singleton(thread_safe=thread_safe)
+    class ParentSingleton:
+        pass
+
+    # Other's __init_subclass__ comes first in the MRO and does not chain
+    class Child(Other, ParentSingleton):
         pass
 
+    if parent_first:
+        parent_instance = ParentSingleton()
+
     with pytest.raises(
         TypeError,
         match=f"Singleton class {ParentSingleton.__name__} cannot be inherited",
     ):
-        ChildSingleton()
+        Child()
+
+    if parent_first:
+        assert ParentSingleton() is parent_instance
+    assert type(ParentSingleton()) is ParentSingleton
 
 
 @pytest.mark.parametrize(
@@ -182,6 +253,32 @@ def test_singleton_with_dataclass(
         assert instance1.value == 10
 
 
+@pytest.mark.parametrize(
+    ("thread_safe", "custom_new"),
+    list(product((True, False), repeat=2)),
+)
+def test_singleton_with_class_argument(thread_safe: bool, custom_new: bool):
+    class Base:
+        if custom_new:
+
+            def __new__(cls, value):
+                return super().__new__(cls)
+
+        def __init__(self, value) -> None:
+            self.value = value
+
+    @singleton(thread_safe=thread_safe)
+    class SingletonWithArgument(Base):
+        pass
+
+    instance1 = SingletonWithArgument(int)
+    instance2 = SingletonWithArgument(str)
+
+    assert instance1 is instance2
+    assert isinstance(instance1, SingletonWithArgument)
+    assert instance1.value is int
+
+
 @pytest.mark.parametrize(
     ("thread_safe", "allow_subclass", "allow_reassignment"),
     list(product((True, False), repeat=3)),
@@ -231,6 +328,25 @@ def test_subclass_not_singleton():
         Child()
 
 
+@pytest.mark.parametrize("thread_safe", (True, False))
+def test_subclass_checked_after_instance_created(thread_safe: bool):
+    @singleton(thread_safe=thread_safe, allow_subclass=True)
+    class ParentSingleton:
+        pass
+
+    class Child(ParentSingleton):
+        pass
+
+    parent_instance = ParentSingleton()
+    assert ParentSingleton() is parent_instance
+
+    with pytest.raises(
+        TypeError,
+        match=f"Subclass {Child.__name__} must also be a singleton",
+    ):
+        Child()
+
+
 def test_instances_do_not_conflict():
     @singleton
     class SingletonA:
@@ -269,10 +385,148 @@ def test_instances_do_not_conflict_with_parent():
     assert instance_a1 is instance_a2
     assert instance_b1 is instance_b2
     assert instance_a1 is not instance_b1
+    # Creating the child instance must not replace the cached parent instance
+    assert Parent() is instance_a1
     assert isinstance(instance_a1, Parent)
     assert isinstance(instance_b1, Child)
 
 
+@pytest.mark.parametrize(
+    ("thread_safe", "parent_first"),
+    list(product((True, False), repeat=2)),
+)
+def test_subclass_inherits_init(thread_safe: bool, parent_first: bool):
+    @singleton(thread_safe=thread_safe, allow_subclass=True)
+    class Parent:
+        def __init__(self, value) -> None:
+            self.value = value
+
+    @singleton(thread_safe=thread_safe)
+    class Child(Parent):
+        pass
+
+    if parent_first:
+        parent_instance = Parent("parent")
+        child_instance = Child("child")
+    else:
+        child_instance = Child("child")
+        parent_instance = Parent("parent")
+
+    assert parent_instance.value == "parent"
+    assert child_instance.value == "child"
+    assert Parent("reassigned") is parent_instance
+    assert Child("reassigned") is child_instance
+    assert parent_instance.value == "parent"
+    assert child_instance.value == "child"
+
+
+@pytest.mark.parametrize(
+    ("thread_safe", "parent_first"),
+    list(product((True, False), repeat=2)),
+)
+def test_subclass_calls_parent_init(thread_safe: bool, parent_first: bool):
+    @singleton(thread_safe=thread_safe, allow_subclass=True)
+    class Parent:
+        def __init__(self, value) -> None:
+            self.value = value
+
+    @singleton(thread_safe=thread_safe)
+    class Child(Parent):
+        def __init__(self, value) -> None:
+            super().__init__(value)
+            self.child_value = value
+
+    if parent_first:
+        parent_instance = Parent("parent")
+        child_instance = Child("child")
+    else:
+        child_instance = Child("child")
+        parent_instance = Parent("parent")
+
+    assert parent_instance.value == "parent"
+    assert child_instance.value == "child"
+    assert child_instance.child_value == "child"
+    assert Parent("reassigned").value == "parent"
+    assert Child("reassigned").value == "child"
+
+
+@pytest.mark.parametrize(
+    ("thread_safe", "parent_first"),
+    list(product((True, False), repeat=2)),
+)
+def test_reassignable_subclass_inherits_init(thread_safe: bool, parent_first: bool):
+    @singleton(thread_safe=thread_safe, allow_subclass=True)
+    class Parent:
+        def __init__(self, value) -> None:
+            self.value = value
+
+    @singleton(thread_safe=thread_safe, allow_reassignment=True)
+    class Child(Parent):
+        pass
+
+    if parent_first:
+        parent_instance = Parent("parent")
+        child_instance = Child("child")
+    else:
+        child_instance = Child("child")
+        parent_instance = Parent("parent")
+
+    assert parent_instance.value == "parent"
+    assert child_instance.value == "child"
+
+    assert Child("reassigned") is child_instance
+    assert child_instance.value == "reassigned"
+    assert Parent("other") is parent_instance
+    assert parent_instance.value == "parent"
+
+
+def test_thread_safe_reentrant_init():
+    @singleton(thread_safe=True)
+    class Registry:
+        def __init__(self) -> None:
+            self.nested = lookup()
+            self.ready = True
+
+    def lookup():
+        return Registry()
+
+    instances = []
+    # Daemon thread, so a deadlock fails the test instead of hanging the run
+    thread = threading.Thread(
+        target=lambda: instances.append(Registry()),
+        daemon=True,
+    )
+    thread.start()
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    assert instances[0] is instances[0].nested
+    assert instances[0].ready
+    assert Registry() is instances[0]
+
+
+@pytest.mark.parametrize("thread_safe", (True, False))
+def test_init_retried_after_error(thread_safe: bool):
+    attempts = []
+
+    @singleton(thread_safe=thread_safe)
+    class FlakySingleton:
+        def __init__(self, value) -> None:
+            attempts.append(value)
+            if len(attempts) == 1:
+                raise ValueError("first attempt fails")
+            self.value = value
+
+    with pytest.raises(ValueError, match="first attempt fails"):
+        FlakySingleton("first")
+
+    instance = FlakySingleton("second")
+    assert instance.value == "second"
+    assert FlakySingleton("third") is instance
+    assert instance.value == "second"
+    assert attempts == ["first", "second"]
+
+
 def test_singleton_flag():
     @singleton(allow_subclass=True)
     class Singleton:
@@ -303,6 +557,9 @@ def test_is_singleton():
         pass
 
     assert is_singleton(Singleton)
+    # Objects with a namespace that are not classes
+    assert not is_singleton(Singleton())
+    assert not is_singleton(test_is_singleton)
 
     @singleton
     class Subclass(Singleton):
@@ -314,3 +571,109 @@ def test_is_singleton():
         pass
 
     assert not is_singleton(NonSingletonSubclass)
+
+
+@pytest.mark.parametrize(
+    ("thread_safe", "allow_subclass"),
+    list(product((True, False), repeat=2)),
+)
+def test_generated_new_shares_code(thread_safe: bool, allow_subclass: bool):
+    @singleton(thread_safe=thread_safe, allow_subclass=allow_subclass)
+    class SingletonA:
+        pass
+
+    @singleton(thread_safe=thread_safe, allow_subclass=allow_subclass)
+    class SingletonB:
+        pass
+
+    assert SingletonA.__new__ is not SingletonB.__new__
+    assert SingletonA.__new__.__code__ is SingletonB.__new__.__code__
+    assert SingletonA() is not SingletonB()
+
+
+def test_register_many():
+    class ServiceA:
+        pass
+
+    class ServiceB:
+        pass
+
+    classes = register_many([ServiceA, ServiceB], thread_safe=True)
+
+    assert classes == [ServiceA, ServiceB]
+    assert all(is_singleton(cls) for cls in classes)
+    assert ServiceA.__new__.__code__ is ServiceB.__new__.__code__
+    assert ServiceA() is ServiceA()
+    assert ServiceB() is ServiceB()
+    assert ServiceA() is not ServiceB()
+
+
+def test_is_singleton_with_flagged_non_class():
+    def function():
+        pass
+
+    setattr(function, _SINGLETON_FLAG, function.__name__)
+    assert not is_singleton(function)
+
+    module = types.ModuleType("module")
+    setattr(module, _SINGLETON_FLAG, module.__name__)
+    assert not is_singleton(module)
+
+    # Carries the flag but has no __name__
+    instance = types.SimpleNamespace(**{_SINGLETON_FLAG: "instance"})
+    assert not is_singleton(instance)
+
+
+def test_same_name_subclass_not_singleton():
+    @singleton(allow_subclass=True)
+    class Service:
+        pass
+
+    base = Service
+
+    class Service(base):  # type: ignore[no-redef]
+        pass
+
+    assert is_singleton(base)
+    assert not is_singleton(Service)
+
+    with pytest.raises(
+        TypeError,
+        match=f"Subclass {Service.__name__} must also be a singleton",
+    ):
+        Service()
+
+
+def test_register_many_with_function():
+    class Service:
+        pass
+
+    with pytest.raises(
+        TypeError,
+        match="singleton decorator can only be applied to classes",
+    ):
+        register_many([Service, len])  # type: ignore
+
+    assert not is_singleton(Service)
+
+
+@pytest.mark.parametrize(
+    ("thread_safe", "allow_subclass"),
+    list(product((True, False), repeat=2)),
+)
+def test_installed_methods_keep_class_names(thread_safe: bool, allow_subclass: bool):
+    @singleton(thread_safe=thread_safe, allow_subclass=allow_subclass)
+    class NamedSingleton:
+        pass
+
+    def check_names():
+        for name in ("__new__", "__init__"):
+            method = getattr(NamedSingleton, name)
+            assert method.__module__ == NamedSingleton.__module__
+            assert method.__name__ == name
+            assert method.__qualname__ == f"{NamedSingleton.__qualname__}.{name}"
+
+    check_names()
+    # The methods swapped in after the first instantiation as well
+    NamedSingleton()
+    check_names()